@@ -1,21 +1,38 @@
 import os
 import sys
-import json
+import re
+import asyncio
+import sqlite3
 import smtplib
+from collections import defaultdict
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 from urllib.parse import urlparse
 
-import requests
-from bs4 import BeautifulSoup
+import httpx
+import orjson
 from dotenv import load_dotenv
+from jinja2 import Environment
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
 from email.mime.text import MIMEText
-from requests.exceptions import RequestException
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # fall back to BeautifulSoup when selectolax isn't installed
+    LexborHTMLParser = None
+    from bs4 import BeautifulSoup, SoupStrainer
 
 # =================== CONFIG =================== #
 
 load_dotenv()
 
-SEEN_JOBS_FILE = "seen_jobs.json"
+# Kept outside the checkout so a fresh clone keeps its history; override with SEEN_JOBS_DB
+DEFAULT_DATA_DIR = os.path.join(os.getenv("XDG_DATA_HOME") or os.path.expanduser("~/.local/share"), "daily-job-report")
+SEEN_JOBS_DB = os.getenv("SEEN_JOBS_DB") or os.path.join(DEFAULT_DATA_DIR, "seen_jobs.sqlite")
+SEEN_JOBS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "seen_jobs.json")  # legacy store, imported once
+SEEN_JOBS_SCHEMA_VERSION = 1  # PRAGMA user_version once the legacy import has run
+SEEN_QUERY_CHUNK_SIZE = 500
 EMAIL_USER = os.getenv("EMAIL_USER")
 EMAIL_PASS = os.getenv("EMAIL_PASS")
 DRY_RUN = os.getenv("DRY_RUN", "1") == "1"  # set to 0 in .env to actually send email
@@ -37,6 +54,24 @@ FREE_DOMAINS = {
     "remoteco.com",
     "workingnotworking.com",
 }
+# Compiled once so each host is scanned in a single pass
+_FREE_RE = re.compile("|".join(map(re.escape, FREE_DOMAINS)))
+_PAID_RE = re.compile("premium|pay|subscription")
+
+# Title/tag substrings that mark a job as frontend related
+FRONTEND_KEYWORDS = ("frontend", "front-end", "react", "vue", "angular", "javascript", "web developer")
+REMOTIVE_KEYWORDS = ("frontend", "front-end", "ui", "react", "vue", "web")
+
+FRONTEND_RE = re.compile("|".join(map(re.escape, FRONTEND_KEYWORDS)))
+REMOTIVE_RE = re.compile("|".join(map(re.escape, REMOTIVE_KEYWORDS)))
+
+# Cap in-flight requests overall and per host so no single site gets hammered
+MAX_CONCURRENT_REQUESTS = 16
+MAX_REQUESTS_PER_HOST = 4
+
+# Transient failures worth retrying with exponential backoff
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_ATTEMPTS = 4
 
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/108.0.0.0 Safari/537.36"
@@ -45,17 +80,41 @@ HEADERS = {
 # =================== HELPERS =================== #
 
 
-def save_seen_jobs(links: set):
-    with open(SEEN_JOBS_FILE, "w") as f:
-        json.dump(list(links), f)
+def save_seen_jobs(conn: sqlite3.Connection, links):
+    with conn:
+        conn.executemany("INSERT OR IGNORE INTO seen VALUES (?)", [(link,) for link in links])
 
-def load_seen_jobs() -> set:
+def load_legacy_seen_jobs() -> set:
     try:
-        with open(SEEN_JOBS_FILE, "r") as f:
-            return set(json.load(f))
-    except (FileNotFoundError, json.JSONDecodeError):
+        with open(SEEN_JOBS_FILE, "rb") as f:
+            return set(orjson.loads(f.read()))
+    except (FileNotFoundError, orjson.JSONDecodeError):
         return set()
 
+def load_seen_jobs() -> sqlite3.Connection:
+    os.makedirs(os.path.dirname(os.path.abspath(SEEN_JOBS_DB)), exist_ok=True)
+    conn = sqlite3.connect(SEEN_JOBS_DB)
+    conn.execute("CREATE TABLE IF NOT EXISTS seen (link TEXT PRIMARY KEY)")
+    if conn.execute("PRAGMA user_version").fetchone()[0] < SEEN_JOBS_SCHEMA_VERSION:
+        # Import the legacy JSON list and record it, so a later empty table isn't refilled
+        with conn:
+            conn.executemany("INSERT OR IGNORE INTO seen VALUES (?)", [(link,) for link in load_legacy_seen_jobs()])
+            conn.execute(f"PRAGMA user_version = {SEEN_JOBS_SCHEMA_VERSION}")
+    return conn
+
+def find_seen_jobs(conn: sqlite3.Connection, links) -> set:
+    # Chunked so large API payloads stay under SQLite's bound-variable limit (999 on older builds)
+    links = list(links)
+    seen = set()
+    for start in range(0, len(links), SEEN_QUERY_CHUNK_SIZE):
+        chunk = links[start:start + SEEN_QUERY_CHUNK_SIZE]
+        placeholders = ", ".join("?" * len(chunk))
+        rows = conn.execute(f"SELECT link FROM seen WHERE link IN ({placeholders})", chunk)
+        seen.update(row[0] for row in rows)
+    return seen
+
+
+@lru_cache(maxsize=4096)
 def apply_host_from_url(url: str) -> str:
     try:
         host = urlparse(url).netloc.lower()
@@ -66,189 +125,273 @@ def apply_host_from_url(url: str) -> str:
         return ""
 
 
+@lru_cache(maxsize=4096)
 def is_likely_free_apply(url: str) -> bool:
     host = apply_host_from_url(url)
     if not host:
         return False
-    if any(domain in host for domain in FREE_DOMAINS):
-        return True
-    if "premium" in host or "pay" in host or "subscription" in host:
-        return False
-    return True
+    return bool(_FREE_RE.search(host)) or not _PAID_RE.search(host)
 
 
-def safe_request(url: str):
-    try:
-        res = requests.get(url, headers=HEADERS, timeout=30)
+def parse_html(text: str, name: str = None, class_: str = None):
+    """Parse a page; name/class_ limit the BeautifulSoup tree to the matching elements."""
+    if LexborHTMLParser is not None:
+        return LexborHTMLParser(text)
+    strainer = SoupStrainer(name, class_=has_class(class_) if class_ else None) if name or class_ else None
+    return BeautifulSoup(text, "lxml", parse_only=strainer)
+
+
+def has_class(name: str):
+    # A plain class_ string only matches the whole attribute, so "job expand" would miss "job"
+    return lambda value: value is not None and name in value.split()
+
+
+def css(node, selector: str) -> list:
+    if LexborHTMLParser is not None:
+        return node.css(selector)
+    return node.select(selector)
+
+
+def css_first(node, selector: str):
+    if LexborHTMLParser is not None:
+        return node.css_first(selector)
+    return node.select_one(selector)
+
+
+def node_text(node) -> str:
+    if LexborHTMLParser is not None:
+        return node.text(strip=True)
+    return node.get_text(strip=True)
+
+
+def node_attr(node, name: str) -> str:
+    if LexborHTMLParser is not None:
+        return node.attributes.get(name) or ""
+    return node.get(name, "")
+
+
+class FetchContext:
+    """HTTP client plus the concurrency limits for a single run.
+
+    The semaphores are created here rather than at import time because an
+    asyncio.Semaphore is bound to the event loop that first waits on it.
+    """
+
+    def __init__(self, client: httpx.AsyncClient):
+        self.client = client
+        self.request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        self.host_semaphores = defaultdict(lambda: asyncio.Semaphore(MAX_REQUESTS_PER_HOST))
+
+
+def create_client() -> httpx.AsyncClient:
+    # One pooled client per run; HTTP/2 hosts multiplex concurrent requests over one connection
+    return httpx.AsyncClient(
+        http2=True,
+        headers=HEADERS,
+        timeout=30,
+        follow_redirects=True,
+        limits=httpx.Limits(
+            max_connections=MAX_CONCURRENT_REQUESTS,
+            max_keepalive_connections=MAX_CONCURRENT_REQUESTS,
+        ),
+    )
+
+
+def is_transient_error(exc: BaseException) -> bool:
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in RETRY_STATUSES
+    return isinstance(exc, httpx.TransportError)
+
+
+@retry(
+    retry=retry_if_exception(is_transient_error),
+    wait=wait_exponential(multiplier=0.5, max=8),
+    stop=stop_after_attempt(MAX_ATTEMPTS),
+    reraise=True,
+)
+async def fetch_with_retry(ctx: FetchContext, url: str):
+    # The semaphores are released before backing off so other requests can proceed.
+    # The host is awaited first so requests queued behind a busy host don't hold global slots.
+    host = urlparse(url).netloc
+    async with ctx.host_semaphores[host], ctx.request_semaphore:
+        res = await ctx.client.get(url)
         res.raise_for_status()
         return res
-    except RequestException as e:
+
+
+async def safe_fetch(ctx: FetchContext, url: str):
+    try:
+        return await fetch_with_retry(ctx, url)
+    except httpx.HTTPError as e:
         raise RuntimeError(f"Network error: {e}") from e
 
 
 # =================== FETCH JOB SOURCES =================== #
 
 
-def fetch_arbeitnow_jobs():
+async def fetch_arbeitnow_jobs(ctx, seen_jobs: sqlite3.Connection):
     """Fetch frontend jobs from Arbeitnow API - free job board"""
     url = "https://www.arbeitnow.com/api/job-board-api"
-    try:
-        res = safe_request(url)
-        data = res.json().get("data", [])
-        jobs = []
-        
-        for job in data:
-            title = job.get("title", "") or ""
-            tags = job.get("tags", [])
-            
-            # Check if frontend related
-            frontend_keywords = ["frontend", "front-end", "react", "vue", "angular", "javascript", "web developer"]
-            if any(keyword in title.lower() for keyword in frontend_keywords) or \
-               any(keyword in " ".join(tags).lower() for keyword in frontend_keywords):
-                company = job.get("company_name", "Unknown")
-                link = job.get("url", "#")
-                location = job.get("location", "Remote")
-                
-                if "remote" in location.lower() or job.get("remote", False):
-                    jobs.append({
-                        "company": company,
-                        "title": title,
-                        "link": link,
-                        "keywords": ["remote", "frontend", "web"],
-                        "skills": ["JavaScript", "React", "CSS"],
-                        "apply_host": apply_host_from_url(link),
-                        "free_to_apply": is_likely_free_apply(link)
-                    })
-        return jobs[:5]
-    except Exception as e:
-        print("Arbeitnow error:", e)
-        return []
-
-
-def fetch_remotive_jobs():
+    res = await safe_fetch(ctx, url)
+    data = orjson.loads(res.content).get("data", [])
+    seen = find_seen_jobs(seen_jobs, [job.get("url", "#") for job in data])
+    jobs = []
+
+    for job in data:
+        link = job.get("url", "#")
+        if link in seen:
+            continue
+        title = job.get("title", "") or ""
+
+        # Check if frontend related; only join the tags when the title misses
+        if not FRONTEND_RE.search(title.lower()):
+            tags = " ".join(job.get("tags", [])).lower()
+            if not FRONTEND_RE.search(tags):
+                continue
+
+        company = job.get("company_name", "Unknown")
+        location = job.get("location", "Remote")
+
+        if "remote" in location.lower() or job.get("remote", False):
+            jobs.append({
+                "company": company,
+                "title": title,
+                "link": link,
+                "keywords": ["remote", "frontend", "web"],
+                "skills": ["JavaScript", "React", "CSS"],
+                "apply_host": apply_host_from_url(link),
+                "free_to_apply": is_likely_free_apply(link)
+            })
+            if len(jobs) == 5:
+                break
+    return jobs
+
+
+async def fetch_remotive_jobs(ctx, seen_jobs: sqlite3.Connection):
     """Fetch frontend jobs from Remotive API"""
     url = "https://remotive.com/api/remote-jobs?category=software-dev"
-    try:
-        res = safe_request(url)
-        data = res.json().get("jobs", [])
-        jobs = []
-        for job in data:
-            title = job.get("title", "") or ""
-            if any(w in title.lower() for w in ["frontend", "front-end", "ui", "react", "vue", "web"]):
-                company = job.get("company_name", "Unknown")
-                link = job.get("url", "#")
-                jobs.append({
-                    "company": company,
-                    "title": title,
-                    "link": link,
-                    "keywords": ["remote", "frontend", "web", "developer"],
-                    "skills": ["React", "Vue", "CSS", "HTML"],
-                    "apply_host": apply_host_from_url(link),
-                    "free_to_apply": is_likely_free_apply(link)
-                })
-        return jobs[:5]
-    except Exception as e:
-        print("Remotive error:", e)
-        return []
+    res = await safe_fetch(ctx, url)
+    data = orjson.loads(res.content).get("jobs", [])
+    seen = find_seen_jobs(seen_jobs, [job.get("url", "#") for job in data])
+    jobs = []
+    for job in data:
+        link = job.get("url", "#")
+        if link in seen:
+            continue
+        title = job.get("title", "") or ""
+        if not REMOTIVE_RE.search(title.lower()):
+            continue
 
+        company = job.get("company_name", "Unknown")
+        jobs.append({
+            "company": company,
+            "title": title,
+            "link": link,
+            "keywords": ["remote", "frontend", "web", "developer"],
+            "skills": ["React", "Vue", "CSS", "HTML"],
+            "apply_host": apply_host_from_url(link),
+            "free_to_apply": is_likely_free_apply(link)
+        })
+        if len(jobs) == 5:
+            break
+    return jobs
 
 
 
 
 
 
-def fetch_remoteok_jobs():
-    """Fetch jobs from Remote OK"""
-    url = "https://remoteok.io/remote-frontend-jobs"
-    try:
-        res = safe_request(url)
-        soup = BeautifulSoup(res.text, "html.parser")
-        jobs = []
-        for job in soup.select(".job")[:5]:
-            title_elem = job.select_one("h2")
-            company_elem = job.select_one("h3")
-            link_elem = job.select_one("a.preventLink")
-
-            if title_elem and company_elem and link_elem:
-                title = title_elem.get_text(strip=True)
-                company = company_elem.get_text(strip=True)
-                link = link_elem['href']
-                if not link.startswith("http"):
-                    link = "https://remoteok.io" + link
-
-                jobs.append({
-                    "company": company,
-                    "title": title,
-                    "link": link,
-                    "keywords": ["remote", "frontend", "developer"],
-                    "skills": ["JavaScript", "React", "HTML", "CSS"],
-                    "apply_host": apply_host_from_url(link),
-                    "free_to_apply": is_likely_free_apply(link)
-                })
-        return jobs
-    except Exception as e:
-        print("Remote OK error:", e)
-        return []
-
-def fetch_jsjobbs_jobs():
-    """Fetch jobs from JSJobbs.com"""
-    url = "https://jsjobbs.com/jobs/remote"
-    try:
-        res = safe_request(url)
-        soup = BeautifulSoup(res.text, "html.parser")
-        jobs = []
-        for job in soup.select(".job-card")[:5]:
-            title = job.select_one(".job-title").get_text(strip=True)
-            company = job.select_one(".company-name").get_text(strip=True)
-            link = job.select_one("a")['href']
+
+def parse_remoteok_jobs(text: str) -> list:
+    tree = parse_html(text, class_="job")
+    jobs = []
+    for job in css(tree, ".job")[:5]:
+        title_elem = css_first(job, "h2")
+        company_elem = css_first(job, "h3")
+        link_elem = css_first(job, "a.preventLink")
+
+        if title_elem and company_elem and link_elem:
+            title = node_text(title_elem)
+            company = node_text(company_elem)
+            link = node_attr(link_elem, "href")
             if not link.startswith("http"):
-                link = "https://jsjobbs.com" + link
+                link = "https://remoteok.io" + link
 
             jobs.append({
                 "company": company,
                 "title": title,
                 "link": link,
-                "keywords": ["remote", "frontend", "javascript"],
-                "skills": ["JavaScript", "React", "Vue", "Angular"],
+                "keywords": ["remote", "frontend", "developer"],
+                "skills": ["JavaScript", "React", "HTML", "CSS"],
                 "apply_host": apply_host_from_url(link),
                 "free_to_apply": is_likely_free_apply(link)
             })
-        return jobs
-    except Exception as e:
-        print("JSJobbs error:", e)
-        return []
+    return jobs
+
+async def fetch_remoteok_jobs(ctx):
+    """Fetch jobs from Remote OK"""
+    url = "https://remoteok.io/remote-frontend-jobs"
+    res = await safe_fetch(ctx, url)
+    # Parse off the event loop so the other sources keep downloading
+    return await asyncio.to_thread(parse_remoteok_jobs, res.text)
+
+def parse_jsjobbs_jobs(text: str) -> list:
+    tree = parse_html(text, class_="job-card")
+    jobs = []
+    for job in css(tree, ".job-card")[:5]:
+        title = node_text(css_first(job, ".job-title"))
+        company = node_text(css_first(job, ".company-name"))
+        link = node_attr(css_first(job, "a"), "href")
+        if not link.startswith("http"):
+            link = "https://jsjobbs.com" + link
+
+        jobs.append({
+            "company": company,
+            "title": title,
+            "link": link,
+            "keywords": ["remote", "frontend", "javascript"],
+            "skills": ["JavaScript", "React", "Vue", "Angular"],
+            "apply_host": apply_host_from_url(link),
+            "free_to_apply": is_likely_free_apply(link)
+        })
+    return jobs
+
+async def fetch_jsjobbs_jobs(ctx):
+    """Fetch jobs from JSJobbs.com"""
+    url = "https://jsjobbs.com/jobs/remote"
+    res = await safe_fetch(ctx, url)
+    return await asyncio.to_thread(parse_jsjobbs_jobs, res.text)
 
-def fetch_wwr_jobs():
+def parse_wwr_jobs(text: str) -> list:
+    tree = parse_html(text, "section", class_="jobs")
+    jobs = []
+    for section in css(tree, "section.jobs")[:3]:
+        for a in css(section, "li a")[:5]:
+            href = node_attr(a, "href")
+            if not href.startswith("http"):
+                href = "https://weworkremotely.com" + href
+            title_elem = css_first(a, "span.title")
+            company_elem = css_first(a, "span.company")
+            title = node_text(title_elem) if title_elem else ""
+            company = node_text(company_elem) if company_elem else ""
+            if not title:
+                continue
+            jobs.append({
+                "company": company or "Unknown",
+                "title": title,
+                "link": href,
+                "keywords": ["frontend", "remote", "javascript"],
+                "skills": ["React", "Vue", "CSS", "HTML"],
+                "apply_host": apply_host_from_url(href),
+                "free_to_apply": is_likely_free_apply(href)
+            })
+    return jobs
+
+async def fetch_wwr_jobs(ctx):
     """Fetch jobs from WeWorkRemotely"""
     url = "https://weworkremotely.com/categories/remote-front-end-programming-jobs"
-    try:
-        res = safe_request(url)
-        soup = BeautifulSoup(res.text, "html.parser")
-        jobs = []
-        for section in soup.select("section.jobs")[:3]:
-            for a in section.select("li a")[:5]:
-                href = a.get("href", "")
-                if not href.startswith("http"):
-                    href = "https://weworkremotely.com" + href
-                title_elem = a.select_one("span.title")
-                company_elem = a.select_one("span.company")
-                title = title_elem.get_text("", strip=True) if title_elem else ""
-                company = company_elem.get_text("", strip=True) if company_elem else ""
-                if not title:
-                    continue
-                jobs.append({
-                    "company": company or "Unknown",
-                    "title": title,
-                    "link": href,
-                    "keywords": ["frontend", "remote", "javascript"],
-                    "skills": ["React", "Vue", "CSS", "HTML"],
-                    "apply_host": apply_host_from_url(href),
-                    "free_to_apply": is_likely_free_apply(href)
-                })
-        return jobs
-    except Exception as e:
-        print("WWR error:", e)
-        return []
+    res = await safe_fetch(ctx, url)
+    return await asyncio.to_thread(parse_wwr_jobs, res.text)
 
 
 
@@ -260,34 +403,41 @@ def fetch_wwr_jobs():
 # =================== JOB AGGREGATION =================== #
 
 
-def fetch_all_jobs(seen_jobs: set):
+async def fetch_all_jobs(seen_jobs: sqlite3.Connection):
     jobs = []
-    sources = [
-        fetch_arbeitnow_jobs,
-        fetch_remotive_jobs,
-        fetch_wwr_jobs,
-        fetch_jsjobbs_jobs,
-        fetch_remoteok_jobs,
-    ]
-    
-    for func in sources:
-        try:
-            fetched = func()
-            jobs.extend(fetched)
-            print(f"[OK] {func.__name__}: {len(fetched)} jobs")
-        except Exception as e:
-            print(f"[FAIL] {func.__name__}: {e}")
-    
-    if not jobs:
-        raise RuntimeError("No jobs found from any source.")
+
+    # All sources are I/O bound, so fetch them concurrently. The API sources
+    # return hundreds of records, so they drop already seen links up front.
+    async with create_client() as client:
+        ctx = FetchContext(client)
+        sources = [
+            fetch_arbeitnow_jobs(ctx, seen_jobs),
+            fetch_remotive_jobs(ctx, seen_jobs),
+            fetch_wwr_jobs(ctx),
+            fetch_jsjobbs_jobs(ctx),
+            fetch_remoteok_jobs(ctx),
+        ]
+        results = await asyncio.gather(*sources, return_exceptions=True)
+
+    failed = 0
+    for source, fetched in zip(sources, results):
+        if isinstance(fetched, Exception):
+            failed += 1
+            print(f"[FAIL] {source.__name__}: {fetched}")
+            continue
+        jobs.extend(fetched)
+        print(f"[OK] {source.__name__}: {len(fetched)} jobs")
+
+    # An empty list is a normal day when the API sources already dropped seen links
+    if failed == len(sources):
+        raise RuntimeError("All job sources failed.")
     
     # Remove duplicates and seen jobs
-    seen_links = set()
-    unique_jobs = []
+    by_link = {}
     for job in jobs:
-        if job["link"] not in seen_links and job["link"] not in seen_jobs:
-            seen_links.add(job["link"])
-            unique_jobs.append(job)
+        by_link.setdefault(job["link"], job)
+    new_links = by_link.keys() - find_seen_jobs(seen_jobs, by_link)
+    unique_jobs = [job for link, job in by_link.items() if link in new_links]
     
     print(f"\nTotal unique jobs found: {len(unique_jobs)}")
     return unique_jobs
@@ -296,46 +446,40 @@ def fetch_all_jobs(seen_jobs: set):
 # =================== EMAIL BUILDING =================== #
 
 
-def create_html_table(jobs):
-    jobs = sorted(jobs, key=lambda j: (not j["free_to_apply"], j["company"]))
-    rows = ""
-    for i, j in enumerate(jobs, 1):
-        free_badge = "Free" if j['free_to_apply'] else "Maybe Paid"
-        free_color = "#28a745" if j['free_to_apply'] else "#ffc107"
-        
-        rows += f"""
-        <tr>
-            <td>{i}</td>
-            <td><b>{j['company']}</b><br/><span style="color: #666;">{j['title']}</span></td>
-            <td><a href="{j['link']}" style="color: #007bff;">Apply Now</a></td>
-            <td>{', '.join(j['keywords'])}</td>
-            <td>{', '.join(j['skills'])}</td>
-            <td>{j['apply_host']}</td>
-            <td style="background-color: {free_color}22; color: {free_color}; font-weight: bold;">{free_badge}</td>
-        </tr>
-        """
-    return f"""
+# Compiled once at import; autoescape covers the untrusted scraped fields
+TABLE_TEMPLATE = Environment(autoescape=True, trim_blocks=True, lstrip_blocks=True).from_string("""
     <html>
     <head>
         <style>
-            body {{ font-family: Arial, sans-serif; margin: 20px; }}
-            h2 {{ color: #333; }}
-            table {{ border-collapse: collapse; width: 100%; }}
-            th {{ background-color: #4CAF50; color: white; padding: 12px; text-align: left; }}
-            td {{ padding: 10px; border-bottom: 1px solid #ddd; }}
-            tr:hover {{ background-color: #f5f5f5; }}
-            a {{ text-decoration: none; }}
+            body { font-family: Arial, sans-serif; margin: 20px; }
+            h2 { color: #333; }
+            table { border-collapse: collapse; width: 100%; }
+            th { background-color: #4CAF50; color: white; padding: 12px; text-align: left; }
+            td { padding: 10px; border-bottom: 1px solid #ddd; }
+            tr:hover { background-color: #f5f5f5; }
+            a { text-decoration: none; }
         </style>
     </head>
     <body>
-        <h2>Daily Global Frontend Developer Jobs ({datetime.now().strftime('%Y-%m-%d')})</h2>
-        <p>Found <strong>{len(jobs)}</strong> remote frontend opportunities today!</p>
+        <h2>Daily Global Frontend Developer Jobs ({{ date }})</h2>
+        <p>Found <strong>{{ jobs|length }}</strong> remote frontend opportunities today!</p>
         <table>
         <tr>
             <th>#</th><th>Company / Role</th><th>Link</th>
             <th>Keywords</th><th>Skills</th><th>Source</th><th>Apply Status</th>
         </tr>
-        {rows}
+        {% for j in jobs %}
+        {% set free_color = "#28a745" if j.free_to_apply else "#ffc107" %}
+        <tr>
+            <td>{{ loop.index }}</td>
+            <td><b>{{ j.company }}</b><br/><span style="color: #666;">{{ j.title }}</span></td>
+            <td><a href="{{ j.link }}" style="color: #007bff;">Apply Now</a></td>
+            <td>{{ j.keywords|join(", ") }}</td>
+            <td>{{ j.skills|join(", ") }}</td>
+            <td>{{ j.apply_host }}</td>
+            <td style="background-color: {{ free_color }}22; color: {{ free_color }}; font-weight: bold;">{{ "Free" if j.free_to_apply else "Maybe Paid" }}</td>
+        </tr>
+        {% endfor %}
         </table>
         <br/>
         <p style="color: #666; font-size: 12px;">
@@ -343,27 +487,71 @@ def create_html_table(jobs):
         </p>
     </body>
     </html>
-    """
+""")
 
 
-def send_email(html):
+def create_html_table(jobs):
+    # Free jobs first, each bucket ordered by company
+    by_company = itemgetter("company")
+    free = sorted((j for j in jobs if j["free_to_apply"]), key=by_company)
+    paid = sorted((j for j in jobs if not j["free_to_apply"]), key=by_company)
+    jobs = free + paid
+    return TABLE_TEMPLATE.render(jobs=jobs, date=datetime.now().strftime('%Y-%m-%d'))
+
+
+class Mailer:
+    """Keeps one authenticated SMTP connection open for every message sent in a run."""
+
+    def __init__(self, host: str = "smtp.gmail.com", port: int = 465):
+        self.host = host
+        self.port = port
+        self.server = None
+
+    def __enter__(self):
+        if not EMAIL_USER or not EMAIL_PASS:
+            raise RuntimeError("EMAIL_USER or EMAIL_PASS missing in .env")
+        self.server = smtplib.SMTP_SSL(self.host, self.port)
+        try:
+            self.server.login(EMAIL_USER, EMAIL_PASS)
+        except Exception:
+            self.server.close()
+            raise
+        return self
+
+    def send(self, msg: MIMEText):
+        self.server.send_message(msg)
+
+    def __exit__(self, *exc):
+        try:
+            self.server.quit()  # also closes the connection
+        except (smtplib.SMTPException, OSError):
+            # Don't let a failed QUIT replace an earlier send error
+            self.server.close()
+
+
+def build_email(html) -> MIMEText:
     msg = MIMEText(html, "html")
     msg["Subject"] = "Daily Remote Frontend Jobs Digest"
     msg["From"] = EMAIL_USER
     msg["To"] = EMAIL_USER
+    return msg
+
 
+def send_emails(messages: list):
     if DRY_RUN:
-        print("\n[DRY RUN] Email prepared but not sent.")
-        print(msg.as_string()[:400] + "...\n")
+        for msg in messages:
+            print("\n[DRY RUN] Email prepared but not sent.")
+            print(msg.as_string()[:400] + "...\n")
         return
 
-    if not EMAIL_USER or not EMAIL_PASS:
-        raise RuntimeError("EMAIL_USER or EMAIL_PASS missing in .env")
+    with Mailer() as mailer:
+        for msg in messages:
+            mailer.send(msg)
+    print(f"Sent {len(messages)} email(s) successfully!")
 
-    with smtplib.SMTP_SSL("smtp.gmail.com", 465) as server:
-        server.login(EMAIL_USER, EMAIL_PASS)
-        server.send_message(msg)
-    print("Email sent successfully!")
+
+def send_email(html):
+    send_emails([build_email(html)])
 
 
 def main():
@@ -372,31 +560,32 @@ def main():
     print("=" * 50)
 
     seen_jobs = load_seen_jobs()
-    print(f"Loaded {len(seen_jobs)} previously seen jobs.")
-    
     try:
-        jobs = fetch_all_jobs(seen_jobs)
-    except RuntimeError as e:
-        print(f"Failed to fetch jobs: {e}")
-        sys.exit(1)
+        print(f"Using seen jobs database: {SEEN_JOBS_DB}")
 
+        try:
+            jobs = asyncio.run(fetch_all_jobs(seen_jobs))
+        except RuntimeError as e:
+            print(f"Failed to fetch jobs: {e}")
+            sys.exit(1)
 
-    if not jobs:
-        print("No new jobs found today.")
-        return
+        if not jobs:
+            print("No new jobs found today.")
+            return
 
-    html = create_html_table(jobs)
-    try:
-        send_email(html)
-    except Exception as e:
-        print(f"Failed to send email: {e}")
-        sys.exit(1)
-
-    # Update seen jobs
-    new_links = {job["link"] for job in jobs}
-    seen_jobs.update(new_links)
-    save_seen_jobs(seen_jobs)
-    print(f"Saved {len(seen_jobs)} seen jobs.")
+        html = create_html_table(jobs)
+        try:
+            send_email(html)
+        except Exception as e:
+            print(f"Failed to send email: {e}")
+            sys.exit(1)
+
+        # Update seen jobs
+        new_links = {job["link"] for job in jobs}
+        save_seen_jobs(seen_jobs, new_links)
+        print(f"Saved {len(new_links)} new seen jobs.")
+    finally:
+        seen_jobs.close()
 
     if DRY_RUN:
         print("\nDry run complete - no email sent.")
@@ -0,0 +1,81 @@
+import asyncio
+
+import httpx
+import pytest
+from tenacity import wait_none
+
+import daily_job_alert
+
+
+async def slow_ok(request):
+    await asyncio.sleep(0.01)
+    return httpx.Response(200, text=request.url.path)
+
+
+async def fetch_many(count):
+    async with httpx.AsyncClient(transport=httpx.MockTransport(slow_ok)) as client:
+        ctx = daily_job_alert.FetchContext(client)
+        urls = [f"https://example.com/{i}" for i in range(count)]
+        responses = await asyncio.gather(*[daily_job_alert.safe_fetch(ctx, url) for url in urls])
+    return [res.text for res in responses]
+
+
+def test_concurrency_limits_work_across_event_loops():
+    # More requests than MAX_REQUESTS_PER_HOST so the host semaphore has to wait
+    count = daily_job_alert.MAX_REQUESTS_PER_HOST * 2
+    expected = [f"/{i}" for i in range(count)]
+    assert asyncio.run(fetch_many(count)) == expected
+    assert asyncio.run(fetch_many(count)) == expected
+
+
+async def slow_host_with_fast_neighbour():
+    release = asyncio.Event()
+
+    async def handler(request):
+        if request.url.host == "slow.example.com":
+            await release.wait()
+        return httpx.Response(200, text=request.url.host)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        ctx = daily_job_alert.FetchContext(client)
+        slow = [
+            asyncio.create_task(daily_job_alert.safe_fetch(ctx, f"https://slow.example.com/{i}"))
+            for i in range(daily_job_alert.MAX_CONCURRENT_REQUESTS)
+        ]
+        await asyncio.sleep(0.01)
+        fast = await asyncio.wait_for(daily_job_alert.safe_fetch(ctx, "https://fast.example.com/"), timeout=1)
+        release.set()
+        await asyncio.gather(*slow)
+    return fast.text
+
+
+def test_busy_host_does_not_block_other_hosts():
+    assert asyncio.run(slow_host_with_fast_neighbour()) == "fast.example.com"
+
+
+def fetch_with_statuses(statuses, calls):
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(statuses[min(len(calls), len(statuses)) - 1])
+
+    async def fetch():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await daily_job_alert.safe_fetch(daily_job_alert.FetchContext(client), "https://example.com/")
+
+    return asyncio.run(fetch())
+
+
+def test_transient_status_is_retried(monkeypatch):
+    monkeypatch.setattr(daily_job_alert.fetch_with_retry.retry, "wait", wait_none())
+    calls = []
+    res = fetch_with_statuses([503, 503, 200], calls)
+    assert res.status_code == 200
+    assert len(calls) == 3
+
+
+def test_client_error_is_not_retried(monkeypatch):
+    monkeypatch.setattr(daily_job_alert.fetch_with_retry.retry, "wait", wait_none())
+    calls = []
+    with pytest.raises(RuntimeError, match="404"):
+        fetch_with_statuses([404, 200], calls)
+    assert len(calls) == 1
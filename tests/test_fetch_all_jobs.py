@@ -0,0 +1,60 @@
+import asyncio
+import json
+import sqlite3
+
+import httpx
+import pytest
+
+import daily_job_alert
+
+ARBEITNOW_LINK = "https://www.arbeitnow.com/jobs/react-developer"
+REMOTIVE_LINK = "https://remotive.com/remote-jobs/software-dev/frontend-engineer"
+
+
+def api_and_empty_pages(request):
+    if request.url.host.endswith("arbeitnow.com"):
+        data = [{"title": "React Developer", "tags": [], "company_name": "A", "url": ARBEITNOW_LINK, "location": "Remote"}]
+        return httpx.Response(200, content=json.dumps({"data": data}))
+    if request.url.host.endswith("remotive.com"):
+        data = [{"title": "Frontend Engineer", "company_name": "R", "url": REMOTIVE_LINK}]
+        return httpx.Response(200, content=json.dumps({"jobs": data}))
+    return httpx.Response(200, text="<html><body></body></html>")
+
+
+def not_found(request):
+    return httpx.Response(404)
+
+
+def seen_conn(links=()):
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE seen (link TEXT PRIMARY KEY)")
+    daily_job_alert.save_seen_jobs(conn, links)
+    return conn
+
+
+def use_transport(monkeypatch, handler):
+    monkeypatch.setattr(
+        daily_job_alert, "create_client", lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+
+
+def test_all_seen_jobs_is_not_a_failure(monkeypatch):
+    use_transport(monkeypatch, api_and_empty_pages)
+    conn = seen_conn([ARBEITNOW_LINK, REMOTIVE_LINK])
+
+    assert asyncio.run(daily_job_alert.fetch_all_jobs(conn)) == []
+
+
+def test_new_jobs_are_returned(monkeypatch):
+    use_transport(monkeypatch, api_and_empty_pages)
+    conn = seen_conn([ARBEITNOW_LINK])
+
+    links = [job["link"] for job in asyncio.run(daily_job_alert.fetch_all_jobs(conn))]
+    assert links == [REMOTIVE_LINK]
+
+
+def test_raises_when_every_source_fails(monkeypatch):
+    use_transport(monkeypatch, not_found)
+
+    with pytest.raises(RuntimeError, match="All job sources failed"):
+        asyncio.run(daily_job_alert.fetch_all_jobs(seen_conn()))
@@ -0,0 +1,33 @@
+import smtplib
+
+import pytest
+
+import daily_job_alert
+
+
+class BrokenSMTP:
+    def __init__(self, host, port):
+        self.closed = 0
+
+    def login(self, user, password):
+        pass
+
+    def send_message(self, msg):
+        raise smtplib.SMTPDataError(554, b"rejected")
+
+    def quit(self):
+        raise ConnectionResetError("connection reset by peer")
+
+    def close(self):
+        self.closed += 1
+
+
+def test_send_error_is_not_masked_by_failed_quit(monkeypatch):
+    monkeypatch.setattr(daily_job_alert, "EMAIL_USER", "user@example.com")
+    monkeypatch.setattr(daily_job_alert, "EMAIL_PASS", "secret")
+    monkeypatch.setattr(daily_job_alert.smtplib, "SMTP_SSL", BrokenSMTP)
+
+    with pytest.raises(smtplib.SMTPDataError):
+        with daily_job_alert.Mailer() as mailer:
+            mailer.send(daily_job_alert.build_email("<p>hi</p>"))
+    assert mailer.server.closed == 1
@@ -0,0 +1,67 @@
+import pytest
+from bs4 import BeautifulSoup, SoupStrainer
+
+import daily_job_alert
+
+REMOTEOK_HTML = """
+<html><head><script>var x = 1;</script></head><body><table>
+<tr class="job expand" data-id="1"><td>
+  <a class="preventLink" href="/remote-jobs/1"><h2> Frontend Dev </h2></a><h3>Acme &amp; Co</h3>
+</td></tr>
+<tr class="job"><td>
+  <a class="preventLink" href="https://remoteok.com/remote-jobs/2"><h2>React Engineer</h2></a><h3>Beta</h3>
+</td></tr>
+<tr class="job"><td><h2>Missing link</h2></td></tr>
+</table></body></html>
+"""
+
+JSJOBBS_HTML = """
+<div class="grid">
+  <div class="job-card featured"><a href="/job/7"><span class="job-title">React Eng</span></a><span class="company-name">JSCo</span></div>
+  <div class="job-card"><a href="https://jsjobbs.com/job/8"><span class="job-title">Vue Dev</span></a><span class="company-name">VCo</span></div>
+</div>
+"""
+
+WWR_HTML = """
+<section class="jobs featured"><ul>
+  <li><a href="/remote-jobs/x"><span class="company">WCo</span><span class="title">Vue <b>Dev</b></span></a></li>
+  <li><a href="/view-all"></a></li>
+</ul></section>
+<section class="jobs"><ul>
+  <li><a href="/remote-jobs/y"><span class="title">Angular Dev</span></a></li>
+</ul></section>
+<footer><section class="other"><li><a href="/z"><span class="title">nope</span></a></li></section></footer>
+"""
+
+PARSERS = [
+    (daily_job_alert.parse_remoteok_jobs, REMOTEOK_HTML),
+    (daily_job_alert.parse_jsjobbs_jobs, JSJOBBS_HTML),
+    (daily_job_alert.parse_wwr_jobs, WWR_HTML),
+]
+
+
+def use_soup_fallback(monkeypatch):
+    monkeypatch.setattr(daily_job_alert, "LexborHTMLParser", None)
+    monkeypatch.setattr(daily_job_alert, "BeautifulSoup", BeautifulSoup, raising=False)
+    monkeypatch.setattr(daily_job_alert, "SoupStrainer", SoupStrainer, raising=False)
+
+
+@pytest.mark.parametrize("parse, html", PARSERS, ids=["remoteok", "jsjobbs", "wwr"])
+def test_both_parsers_find_the_same_jobs(parse, html, monkeypatch):
+    pytest.importorskip("selectolax")
+    from selectolax.lexbor import LexborHTMLParser
+
+    monkeypatch.setattr(daily_job_alert, "LexborHTMLParser", LexborHTMLParser)
+    lexbor_jobs = parse(html)
+
+    use_soup_fallback(monkeypatch)
+    soup_jobs = parse(html)
+
+    assert lexbor_jobs
+    assert soup_jobs == lexbor_jobs
+
+
+def test_multi_class_elements_survive_the_strainer(monkeypatch):
+    use_soup_fallback(monkeypatch)
+    links = [job["link"] for job in daily_job_alert.parse_remoteok_jobs(REMOTEOK_HTML)]
+    assert links == ["https://remoteok.io/remote-jobs/1", "https://remoteok.com/remote-jobs/2"]
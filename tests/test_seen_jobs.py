@@ -0,0 +1,15 @@
+import sqlite3
+
+import daily_job_alert
+
+
+def test_find_seen_jobs_handles_more_links_than_one_query_allows():
+    conn = sqlite3.connect(":memory:")
+    # Mimic older SQLite builds that allow at most 999 bound variables
+    conn.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 999)
+    conn.execute("CREATE TABLE seen (link TEXT PRIMARY KEY)")
+    links = [f"https://example.com/{i}" for i in range(2500)]
+    daily_job_alert.save_seen_jobs(conn, links[::2])
+
+    assert daily_job_alert.find_seen_jobs(conn, links) == set(links[::2])
+    assert daily_job_alert.find_seen_jobs(conn, []) == set()